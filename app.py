@@ -4,102 +4,221 @@ Client Research Agent - Streamlit Web App
 Professional web interface for AI-powered client research
 """
 
+# Annotations stay lazy so type hints don't force eager imports below
+from __future__ import annotations
+
 import streamlit as st
-import anthropic
+import asyncio
+import csv
 import os
-import requests
 import json
 from datetime import datetime, timedelta
-from typing import Dict, List, Any
-from googlesearch import search
+import time
+from typing import Dict, List, Any, Tuple
 from dotenv import load_dotenv
 import io
 
+# Heavy third-party imports (anthropic, aiohttp, googlesearch) are deferred
+# into the functions that use them so the UI paints without paying for them
+
+from llm_cache import LLMCache, ANALYSIS_CACHE_TTL, SEARCH_CACHE_TTL
+from semantic_cache import SemanticCache
+
 # Load environment variables
 load_dotenv()
 
+# Model tiers for the analysis call. Haiku is roughly 4x cheaper and 2x
+# faster than Sonnet and is plenty for this structured summarization, so it's
+# the default; Sonnet stays available for deeper analysis
+ANALYSIS_MODELS = ["claude-3-5-haiku-20241022", "claude-sonnet-4-20250514"]
+
+# Output ceiling shared by the supported models (3.5 Haiku caps at 8192), and
+# the company budget per combined call derived from it: at ~1000 output tokens
+# per analysis, more than 8 companies would overflow the cap
+MAX_OUTPUT_TOKENS = 8192
+BATCH_COMPANIES_PER_CALL = MAX_OUTPUT_TOKENS // 1000
+
+# Stable analysis instructions, hoisted so the text is byte-identical across
+# calls and kept out of the per-company user message. Note: at ~70 tokens this
+# is far below Anthropic's minimum cacheable prefix (1024+ tokens depending on
+# model), so no cache_control marker is set — add one only if the
+# instructions ever grow past that threshold
+ANALYSIS_INSTRUCTIONS = """You are preparing research for an AI consulting firm ahead of a client meeting.
+
+Analyze the research provided about the company and provide:
+1. Key Company Insights (3-5 bullet points)
+2. Potential AI Pain Points to Explore (3-4 specific areas)
+3. Conversation Starters (3-4 strategic questions)
+
+Format the response as clear, actionable insights for a consulting meeting."""
+
+# Batch variant: same analysis, but one call covers several companies and the
+# response comes back as JSON so it can be split into per-company briefings
+BATCH_ANALYSIS_INSTRUCTIONS = ANALYSIS_INSTRUCTIONS + """
+
+You will receive research for several companies at once. Respond with a single
+JSON object mapping each company name (exactly as given) to its full analysis
+as a markdown string. Return only the JSON object, with no surrounding text."""
+
+def format_research_lines(search_results: Dict[str, Any]) -> str:
+    """Render search results as compact one-line-per-result prompt text"""
+    return "\n".join(
+        f"[{category}] {result.get('title', '')} — {result.get('url', '')}"
+        for category, results in search_results.items()
+        for result in results
+    )
+
+def extract_title(head: bytes) -> str:
+    """Extract the page <title> from the first chunk of an HTML response"""
+    try:
+        from selectolax.parser import HTMLParser
+        node = HTMLParser(head).css_first('title')
+        if node is not None:
+            title = node.text(strip=True)
+            if title:
+                return title
+    except ImportError:
+        # selectolax not installed; fall back to a plain string scan
+        text = head.decode('utf-8', errors='ignore')
+        if '<title>' in text:
+            start = text.find('<title>') + 7
+            end = text.find('</title>', start)
+            if end > start:
+                return text[start:end].strip()
+    except Exception:
+        pass
+    return "Search Result"
+
 class ClientResearchAgent:
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, use_cache: bool = True, model: str = ANALYSIS_MODELS[0]):
         self.anthropic_client = None
+        self.use_cache = use_cache
+        self.model = model
+        self.cache = LLMCache()
+        self.semantic_cache = SemanticCache()
         # Try API key from parameter first, then environment variable
         key_to_use = api_key or os.getenv('ANTHROPIC_API_KEY')
         if key_to_use:
             try:
-                self.anthropic_client = anthropic.Anthropic(api_key=key_to_use)
+                self.anthropic_client = get_anthropic_client(key_to_use)
             except Exception as e:
                 st.error(f"Invalid API key: {e}")
                 self.anthropic_client = None
     
-    def search_company_info(self, company_name: str, location: str = "") -> Dict[str, Any]:
-        """Search for company information using web search"""
+    async def search_company_info(self, company_name: str, location: str = "") -> Tuple[Dict[str, Any], List[str]]:
+        """Search for company information using web search (all categories run concurrently)
+
+        Returns the results plus the categories that failed and fell back to
+        simulated placeholders, so the caller can warn the user in-page.
+        """
+        import aiohttp
+
         location_query = f" {location}" if location.strip() else ""
-        
+
         searches = {
             'recent_news': f"{company_name}{location_query} news 2024 recent developments",
             'financial_updates': f"{company_name}{location_query} financial results earnings revenue growth 2024",
             'ai_trends': f"{company_name}{location_query} AI artificial intelligence technology adoption digital transformation"
         }
-        
+
+        timeout = aiohttp.ClientTimeout(total=5)
+        headers = {
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+        }
+
+        async with aiohttp.ClientSession(timeout=timeout, headers=headers) as session:
+            gathered = await asyncio.gather(
+                *[self.perform_google_search(session, query) for query in searches.values()],
+                return_exceptions=True
+            )
+
         results = {}
-        progress_bar = st.progress(0)
-        status_text = st.empty()
-        
-        for i, (category, query) in enumerate(searches.items()):
-            status_text.text(f"🔍 Searching for {category.replace('_', ' ')}...")
-            progress_bar.progress((i + 1) / len(searches))
-            
-            try:
-                results[category] = self.perform_google_search(query)
-            except Exception as e:
-                st.warning(f"Search failed for {category}: {e}")
+        failed_categories = []
+        for (category, query), result in zip(searches.items(), gathered):
+            if isinstance(result, Exception):
+                print(f"Search failed for {category}: {result}")
                 results[category] = self.simulate_search_results(query)
-        
-        status_text.text("✅ Search complete!")
-        return results
-    
-    def perform_google_search(self, query: str, num_results: int = 5) -> List[Dict[str, str]]:
+                failed_categories.append(category)
+            else:
+                results[category] = result
+
+        return results, failed_categories
+
+    async def perform_google_search(self, session: aiohttp.ClientSession, query: str, num_results: int = 5) -> List[Dict[str, str]]:
         """Perform actual Google search using googlesearch-python"""
+        cache_key = LLMCache.cache_key({'search': query, 'num_results': num_results})
+        if self.use_cache:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        from googlesearch import search
+
+        # Google search is blocking, so run it in a worker thread; the three
+        # category searches then overlap instead of running back-to-back.
+        # advanced=True returns titles and descriptions directly, so most
+        # results need no follow-up page fetch at all. Failures propagate to
+        # search_company_info, which records them and substitutes placeholders
+        hits = await asyncio.to_thread(
+            lambda: list(search(query, num_results=num_results, sleep_interval=0, advanced=True))
+        )
+
         search_results = []
-        
+        pending = []
+        for i, hit in enumerate(hits):
+            url = getattr(hit, 'url', str(hit))
+            title = (getattr(hit, 'title', None) or '').strip()
+            description = (getattr(hit, 'description', None) or '').strip()
+
+            if title:
+                search_results.append({
+                    "title": title[:100] + "..." if len(title) > 100 else title,
+                    "snippet": description or f"Search result {i+1} for: {query}",
+                    "url": url,
+                    "date": datetime.now().strftime("%Y-%m-%d")
+                })
+            else:
+                # Rare: no title in the search result; fall back to a bounded
+                # page fetch, still run concurrently with the others
+                search_results.append(None)
+                pending.append((len(search_results) - 1, self.fetch_search_result(session, i, url, query)))
+
+        if pending:
+            fetched = await asyncio.gather(*[coro for _, coro in pending])
+            for (position, _), result in zip(pending, fetched):
+                search_results[position] = result
+
+        if not search_results:
+            raise RuntimeError(f"Google search returned no results for: {query}")
+
+        if self.use_cache:
+            self.cache.set(cache_key, search_results, ttl=SEARCH_CACHE_TTL)
+        return search_results
+
+    async def fetch_search_result(self, session: aiohttp.ClientSession, i: int, url: str, query: str) -> Dict[str, str]:
+        """Fetch a single result page and extract its title"""
         try:
-            # Get search results
-            urls = list(search(query, num_results=num_results, sleep_interval=1))
-            
-            for i, url in enumerate(urls):
-                # For each URL, try to get title and snippet
-                try:
-                    response = requests.get(url, timeout=5, headers={
-                        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-                    })
-                    
-                    # Extract title from HTML (basic extraction)
-                    title = "Search Result"
-                    if '<title>' in response.text:
-                        start = response.text.find('<title>') + 7
-                        end = response.text.find('</title>', start)
-                        if end > start:
-                            title = response.text[start:end].strip()
-                    
-                    search_results.append({
-                        "title": title[:100] + "..." if len(title) > 100 else title,
-                        "snippet": f"Search result {i+1} for: {query}",
-                        "url": url,
-                        "date": datetime.now().strftime("%Y-%m-%d")
-                    })
-                except Exception as e:
-                    # If we can't fetch the page, still include the URL
-                    search_results.append({
-                        "title": f"Search Result {i+1}",
-                        "snippet": f"Found via search for: {query}",
-                        "url": url,
-                        "date": datetime.now().strftime("%Y-%m-%d")
-                    })
-        
+            async with session.get(url) as response:
+                # Titles live in <head>; reading ~64KB bounds bandwidth and
+                # memory instead of downloading the whole page
+                head = await response.content.read(65536)
+
+            title = extract_title(head)
+
+            return {
+                "title": title[:100] + "..." if len(title) > 100 else title,
+                "snippet": f"Search result {i+1} for: {query}",
+                "url": url,
+                "date": datetime.now().strftime("%Y-%m-%d")
+            }
         except Exception as e:
-            print(f"Google search failed: {e}")
-            return self.simulate_search_results(query)
-        
-        return search_results if search_results else self.simulate_search_results(query)
+            # If we can't fetch the page, still include the URL
+            return {
+                "title": f"Search Result {i+1}",
+                "snippet": f"Found via search for: {query}",
+                "url": url,
+                "date": datetime.now().strftime("%Y-%m-%d")
+            }
     
     def simulate_search_results(self, query: str) -> List[Dict[str, str]]:
         """Simulate search results - fallback when real search fails"""
@@ -117,32 +236,209 @@ class ClientResearchAgent:
         if not self.anthropic_client:
             return self.generate_fallback_analysis(company_name, meeting_type, search_results)
         
-        prompt = f"""
-        Analyze the following research about {company_name} for a {meeting_type} meeting with an AI consulting firm.
-
-        Research Results:
-        {json.dumps(search_results, indent=2)}
-
-        Please provide:
-        1. Key Company Insights (3-5 bullet points)
-        2. Potential AI Pain Points to Explore (3-4 specific areas)
-        3. Conversation Starters (3-4 strategic questions)
+        # Compact one-line-per-result format: pretty-printed JSON (indents,
+        # snippets, dates) roughly triples the input tokens for no extra signal
+        research_lines = format_research_lines(search_results)
+
+        prompt = f"""Company: {company_name}
+Meeting: {meeting_type}
+
+Research Results:
+{research_lines}"""
+
+        cache_key = LLMCache.cache_key({
+            'model': self.model,
+            'system': ANALYSIS_INSTRUCTIONS,
+            'prompt': prompt
+        })
+        # Only the company name is fuzzy-matched; meeting type and model must
+        # match exactly so one client's discovery analysis never stands in
+        # for a proposal and a Sonnet run never gets a Haiku answer
+        semantic_metadata = {'meeting_type': meeting_type, 'model': self.model}
+        if self.use_cache:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+            # Exact hash missed; try a near-match on the company name
+            # (catches variants like "Tesla Inc" vs "Tesla")
+            cached = self.semantic_cache.get(company_name, semantic_metadata, max_age=ANALYSIS_CACHE_TTL)
+            if cached is not None:
+                return cached
 
-        Format the response as clear, actionable insights for a consulting meeting.
-        """
-        
         try:
-            with st.spinner("🧠 Analyzing findings with AI..."):
-                message = self.anthropic_client.messages.create(
-                    model="claude-sonnet-4-20250514",
-                    max_tokens=1000,
-                    messages=[{"role": "user", "content": prompt}]
-                )
-                return message.content[0].text
+            # Stream tokens into the page as they're generated, so the user
+            # sees insights at time-to-first-token instead of waiting for
+            # the full response
+            with self.anthropic_client.messages.stream(
+                model=self.model,
+                max_tokens=1000,
+                system=ANALYSIS_INSTRUCTIONS,
+                messages=[{"role": "user", "content": prompt}]
+            ) as stream:
+                st.write_stream(stream.text_stream)
+                analysis = stream.get_final_message().content[0].text
+
+            if self.use_cache:
+                self.cache.set(cache_key, analysis, ttl=ANALYSIS_CACHE_TTL)
+                self.semantic_cache.put(company_name, analysis, semantic_metadata)
+            return analysis
         except Exception as e:
             st.warning(f"AI analysis failed: {e}")
             return self.generate_fallback_analysis(company_name, meeting_type, search_results)
     
+    async def batch_search(self, companies: List[str], location: str = "") -> Tuple[Dict[str, Dict[str, Any]], Dict[str, List[str]]]:
+        """Run the research searches for several companies concurrently
+
+        Returns the results per company plus the categories that failed per
+        company, so the caller can warn the user in-page.
+        """
+        gathered = await asyncio.gather(
+            *[self.search_company_info(company, location) for company in companies],
+            return_exceptions=True
+        )
+
+        results = {}
+        failed = {}
+        for company, result in zip(companies, gathered):
+            if isinstance(result, Exception):
+                print(f"Search failed for {company}: {result}")
+                results[company] = {}
+                failed[company] = ['all categories']
+            else:
+                results[company], failed_categories = result
+                if failed_categories:
+                    failed[company] = failed_categories
+        return results, failed
+
+    def batch_analyze(self, companies: List[str], meeting_type: str, search_results_by_company: Dict[str, Dict[str, Any]]) -> Dict[str, str]:
+        """Analyze several companies in combined Claude calls
+
+        Combining companies amortizes the per-request overhead. The list is
+        chunked so each call's output budget stays under the model's token
+        ceiling; a long CSV makes several calls instead of one oversized one.
+        """
+        if not self.anthropic_client:
+            return {
+                company: self.generate_fallback_analysis(company, meeting_type, search_results_by_company.get(company, {}))
+                for company in companies
+            }
+
+        analyses = {}
+        for start in range(0, len(companies), BATCH_COMPANIES_PER_CALL):
+            chunk = companies[start:start + BATCH_COMPANIES_PER_CALL]
+            analyses.update(self.batch_analyze_chunk(chunk, meeting_type, search_results_by_company))
+        return analyses
+
+    def batch_analyze_chunk(self, companies: List[str], meeting_type: str, search_results_by_company: Dict[str, Dict[str, Any]]) -> Dict[str, str]:
+        """Analyze one chunk of companies in a single Claude call"""
+        sections = [
+            f"## {company}\n{format_research_lines(search_results_by_company.get(company, {}))}"
+            for company in companies
+        ]
+
+        prompt = f"""Meeting: {meeting_type}
+
+Analyze the following {len(companies)} companies:
+
+""" + "\n\n".join(sections)
+
+        cache_key = LLMCache.cache_key({
+            'model': self.model,
+            'system': BATCH_ANALYSIS_INSTRUCTIONS,
+            'prompt': prompt
+        })
+        if self.use_cache:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        try:
+            message = self.anthropic_client.messages.create(
+                model=self.model,
+                max_tokens=min(1000 * len(companies), MAX_OUTPUT_TOKENS),
+                system=BATCH_ANALYSIS_INSTRUCTIONS,
+                messages=[{"role": "user", "content": prompt}]
+            )
+            text = message.content[0].text.strip()
+            # Tolerate a fenced code block around the JSON
+            if text.startswith("```"):
+                text = text.split("\n", 1)[1].rsplit("```", 1)[0]
+            parsed = json.loads(text)
+        except Exception as e:
+            st.warning(f"Batch analysis failed: {e}")
+            return {
+                company: self.generate_fallback_analysis(company, meeting_type, search_results_by_company.get(company, {}))
+                for company in companies
+            }
+
+        # Match tolerantly: the model sometimes normalizes company names
+        # (case, whitespace, trailing periods), which would otherwise drop
+        # its answer on the floor
+        normalized = {str(key).strip().lower().rstrip('.'): value for key, value in parsed.items()}
+
+        analyses = {}
+        used_fallback = False
+        for company in companies:
+            analysis = parsed.get(company) or normalized.get(company.strip().lower().rstrip('.'))
+            if not analysis:
+                analysis = self.generate_fallback_analysis(company, meeting_type, search_results_by_company.get(company, {}))
+                used_fallback = True
+            analyses[company] = analysis
+
+        # Only cache fully successful chunks, so a retry after a partial
+        # response isn't served the degraded output for an hour
+        if self.use_cache and not used_fallback:
+            self.cache.set(cache_key, analyses, ttl=ANALYSIS_CACHE_TTL)
+        return analyses
+
+    def analyze_findings_batch(self, items: List[Tuple[str, str, Dict[str, Any]]]) -> List[str]:
+        """Analyze companies through Anthropic's Batch API
+
+        Batched jobs are billed at 50% of standard pricing with up to a
+        24-hour turnaround — meant for offline bulk runs, not interactive use.
+        Each item is a (company_name, meeting_type, search_results) tuple.
+        """
+        if not self.anthropic_client:
+            return [
+                self.generate_fallback_analysis(company_name, meeting_type, search_results)
+                for company_name, meeting_type, search_results in items
+            ]
+
+        batch_requests = []
+        for idx, (company_name, meeting_type, search_results) in enumerate(items):
+            prompt = f"""Company: {company_name}
+Meeting: {meeting_type}
+
+Research Results:
+{format_research_lines(search_results)}"""
+            batch_requests.append({
+                "custom_id": f"company-{idx}",
+                "params": {
+                    "model": self.model,
+                    "max_tokens": 1000,
+                    "system": ANALYSIS_INSTRUCTIONS,
+                    "messages": [{"role": "user", "content": prompt}]
+                }
+            })
+
+        analyses = {}
+        try:
+            batch = self.anthropic_client.messages.batches.create(requests=batch_requests)
+            while batch.processing_status != "ended":
+                time.sleep(30)
+                batch = self.anthropic_client.messages.batches.retrieve(batch.id)
+
+            for result in self.anthropic_client.messages.batches.results(batch.id):
+                if result.result.type == "succeeded":
+                    analyses[result.custom_id] = result.result.message.content[0].text
+        except Exception as e:
+            st.warning(f"Batch API analysis failed: {e}")
+
+        return [
+            analyses.get(f"company-{idx}") or self.generate_fallback_analysis(company_name, meeting_type, search_results)
+            for idx, (company_name, meeting_type, search_results) in enumerate(items)
+        ]
+
     def generate_fallback_analysis(self, company_name: str, meeting_type: str, search_results: Dict[str, Any]) -> str:
         """Generate basic analysis without AI when API is unavailable"""
         return f"""
@@ -201,6 +497,383 @@ class ClientResearchAgent:
 """
         return briefing
 
+# Custom CSS styling - SkyeStaq Brand Guidelines (frozen at import so
+# reruns reuse the same string object instead of rebuilding it)
+_CSS = """
+<link href="https://fonts.googleapis.com/css2?family=Montserrat+Alternates:wght@600&family=Manrope:wght@600&display=swap" rel="stylesheet">
+
+<style>
+/* ==================== CSS Variables - Brand Colors ==================== */
+:root {
+    --summit-slate: #333447;
+    --glen-fire: #CC6651;
+    --highland-sand: #D8C3A5;
+    --white: #ffffff;
+    --light-bg: #f9f8f6;
+    --light-gray: #e8e6e2;
+}
+
+/* ==================== Typography - Brand Guidelines ==================== */
+/* H1: Main headers - Montserrat Alternates Semibold 600 */
+h1, .stTitle {
+    font-family: 'Montserrat Alternates', sans-serif !important;
+    font-weight: 600 !important;
+    font-size: 2.67rem !important;
+    letter-spacing: -0.5px !important;
+    color: var(--glen-fire) !important;
+}
+
+/* H2-H6: Section headers - Manrope Semibold 600 */
+h2, h3, h4, h5, h6, .stHeader {
+    font-family: 'Manrope', sans-serif !important;
+    font-weight: 600 !important;
+    color: var(--glen-fire) !important;
+}
+
+h2 {
+    font-size: 2rem !important;
+    letter-spacing: -0.5px !important;
+}
+
+/* Body text - Arial/Helvetica with enhanced readability */
+body, .stMarkdown, p, div, span, label {
+    font-family: Arial, Helvetica, sans-serif !important;
+    font-size: 1.125rem !important;
+    line-height: 1.7 !important;
+    color: var(--summit-slate) !important;
+}
+
+/* ==================== Main App Layout ==================== */
+.stApp {
+    background-color: var(--highland-sand);
+}
+
+/* Main content area with proper spacing */
+.main .block-container {
+    padding-top: 3rem;
+    padding-bottom: 3rem;
+    padding-left: 2rem;
+    padding-right: 2rem;
+    background-color: var(--highland-sand);
+}
+
+/* Header/Title area - Summit Slate background */
+header[data-testid="stHeader"] {
+    background-color: var(--summit-slate) !important;
+}
+
+/* Top toolbar area */
+[data-testid="stToolbar"] {
+    background-color: var(--summit-slate) !important;
+}
+
+/* Main title section background */
+.main .block-container > div:first-child {
+    background-color: var(--summit-slate);
+    margin: -3rem -2rem 1rem -2rem;
+    padding: 2rem 2rem 1.5rem 2rem;
+    border-radius: 0 0 16px 16px;
+}
+
+/* Subtitle/italics in title section - keep white on dark background */
+.main .block-container > div:first-child em,
+.main .block-container > div:first-child .stMarkdown em {
+    color: var(--highland-sand) !important;
+}
+
+/* Reduce spacing after divider following title */
+.main .block-container > div:first-child hr {
+    margin-bottom: 0.5rem !important;
+}
+
+/* ==================== Sidebar Styling ==================== */
+.css-1d391kg, [data-testid="stSidebar"] {
+    background-color: var(--summit-slate);
+    padding: 2rem 1rem;
+    width: 400px !important;
+    min-width: 400px !important;
+}
+
+/* Sidebar headings - reduced sizes for legibility */
+[data-testid="stSidebar"] h2 {
+    color: var(--glen-fire) !important;
+    font-size: 1.5rem !important;
+    letter-spacing: 0px !important;
+    margin-bottom: 0.5rem !important;
+    margin-top: 0.5rem !important;
+}
+
+[data-testid="stSidebar"] h3 {
+    color: var(--glen-fire) !important;
+    font-size: 1.25rem !important;
+    letter-spacing: 0px !important;
+    margin-top: 0.75rem !important;
+    margin-bottom: 0.5rem !important;
+}
+
+/* Sidebar text and labels - keep white text in sidebar */
+[data-testid="stSidebar"] p,
+[data-testid="stSidebar"] label,
+[data-testid="stSidebar"] div,
+[data-testid="stSidebar"] span,
+[data-testid="stSidebar"] .stMarkdown {
+    font-size: 0.95rem !important;
+    line-height: 1.5 !important;
+    color: var(--white) !important;
+}
+
+/* Sidebar captions - keep light color */
+[data-testid="stSidebar"] .stCaption {
+    font-size: 0.85rem !important;
+    color: var(--highland-sand) !important;
+}
+
+/* Sidebar logo - 50% width, centered */
+[data-testid="stSidebar"] img {
+    width: 50% !important;
+    margin-left: auto !important;
+    margin-right: auto !important;
+    display: block !important;
+    margin-bottom: 0.5rem !important;
+}
+
+/* Sidebar dividers - tighter spacing */
+[data-testid="stSidebar"] hr {
+    margin-top: 0.5rem !important;
+    margin-bottom: 0.5rem !important;
+}
+
+/* Sidebar status messages - tighter spacing */
+[data-testid="stSidebar"] .stSuccess,
+[data-testid="stSidebar"] .stInfo,
+[data-testid="stSidebar"] .stWarning,
+[data-testid="stSidebar"] .stError {
+    margin-bottom: 0.25rem !important;
+    padding: 0.5rem !important;
+}
+
+/* ==================== Input Elements ==================== */
+/* Text inputs with proper spacing */
+.stTextInput > div > div > input {
+    background-color: var(--white);
+    color: var(--summit-slate);
+    border: 2px solid var(--light-gray);
+    border-radius: 8px;
+    padding: 0.75rem 1rem;
+    font-size: 1.125rem;
+    transition: all 0.3s ease;
+}
+
+.stTextInput > div > div > input:focus {
+    border-color: var(--glen-fire);
+    box-shadow: 0 0 0 3px rgba(204, 102, 81, 0.1);
+}
+
+/* Select box styling */
+.stSelectbox > div > div {
+    background-color: var(--white);
+    border-radius: 8px;
+}
+
+.stSelectbox > div > div > div {
+    color: var(--summit-slate);
+    padding: 0.75rem 1rem;
+}
+
+/* ==================== Buttons - Brand Styled CTAs ==================== */
+/* Primary button - Glen Fire */
+.stButton > button {
+    background-color: var(--glen-fire);
+    color: var(--white);
+    border: none;
+    border-radius: 8px;
+    padding: 0.75rem 2rem;
+    font-weight: 600;
+    font-size: 1.125rem;
+    transition: all 0.3s ease;
+    box-shadow: 0 4px 12px rgba(204, 102, 81, 0.2);
+}
+
+.stButton > button:hover {
+    background-color: #d47561;
+    transform: translateY(-2px);
+    box-shadow: 0 6px 16px rgba(204, 102, 81, 0.3);
+}
+
+/* Download button */
+.stDownloadButton > button {
+    background-color: var(--glen-fire);
+    color: var(--white);
+    border: none;
+    border-radius: 8px;
+    padding: 0.75rem 2rem;
+    font-weight: 600;
+    transition: all 0.3s ease;
+    box-shadow: 0 4px 12px rgba(204, 102, 81, 0.2);
+}
+
+.stDownloadButton > button:hover {
+    background-color: #d47561;
+    transform: translateY(-2px);
+    box-shadow: 0 6px 16px rgba(204, 102, 81, 0.3);
+}
+
+/* ==================== Cards and Panels ==================== */
+/* Content cards with brand-specified styling */
+[data-testid="stExpander"],
+[data-testid="stAlert"] {
+    background-color: rgba(255, 255, 255, 0.05);
+    border-radius: 16px;
+    padding: 1.5rem;
+    box-shadow: 0 10px 30px rgba(51, 52, 71, 0.1);
+    border: 1px solid rgba(216, 195, 165, 0.1);
+}
+
+/* Expandable sections */
+.streamlit-expanderHeader {
+    background-color: rgba(204, 102, 81, 0.1);
+    color: var(--glen-fire) !important;
+    border-radius: 8px;
+    padding: 1rem;
+    font-weight: 600;
+}
+
+.streamlit-expanderHeader:hover {
+    background-color: rgba(204, 102, 81, 0.2);
+}
+
+/* ==================== Status Messages ==================== */
+/* Success/Info/Warning/Error with proper brand styling */
+.stSuccess {
+    background-color: rgba(204, 102, 81, 0.1);
+    border-left: 4px solid var(--glen-fire);
+    border-radius: 8px;
+    padding: 1rem;
+}
+
+.stInfo {
+    background-color: rgba(216, 195, 165, 0.1);
+    border-left: 4px solid var(--highland-sand);
+    border-radius: 8px;
+    padding: 1rem;
+}
+
+.stWarning {
+    background-color: rgba(255, 183, 77, 0.1);
+    border-left: 4px solid #ffb74d;
+    border-radius: 8px;
+    padding: 1rem;
+}
+
+.stError {
+    background-color: rgba(239, 83, 80, 0.1);
+    border-left: 4px solid #ef5350;
+    border-radius: 8px;
+    padding: 1rem;
+}
+
+/* ==================== Progress Indicators ==================== */
+.stProgress > div > div > div > div {
+    background-color: var(--glen-fire);
+}
+
+.stSpinner > div {
+    border-top-color: var(--glen-fire) !important;
+}
+
+/* ==================== Dividers and Spacing ==================== */
+hr {
+    border: none;
+    border-top: 2px solid var(--light-gray);
+    margin: 2rem 0;
+    opacity: 0.2;
+}
+
+/* ==================== Code and Pre-formatted Text ==================== */
+.stCode, code, pre {
+    background-color: rgba(51, 52, 71, 0.8);
+    color: var(--highland-sand);
+    border-radius: 8px;
+    padding: 1rem;
+    border: 1px solid var(--light-gray);
+}
+
+/* ==================== Captions and Helper Text ==================== */
+.stCaption, caption, small {
+    color: var(--highland-sand) !important;
+    font-size: 0.9rem !important;
+    line-height: 1.5 !important;
+}
+
+/* ==================== Links ==================== */
+a {
+    color: var(--glen-fire) !important;
+    text-decoration: none;
+    transition: all 0.3s ease;
+}
+
+a:hover {
+    color: var(--highland-sand) !important;
+    text-decoration: underline;
+}
+
+/* ==================== Metric Cards ==================== */
+[data-testid="stMetric"] {
+    background-color: rgba(255, 255, 255, 0.05);
+    border: 1px solid rgba(204, 102, 81, 0.2);
+    border-radius: 16px;
+    padding: 1.5rem;
+    box-shadow: 0 10px 30px rgba(51, 52, 71, 0.1);
+}
+
+/* ==================== Animations ==================== */
+@keyframes fadeIn {
+    from {
+        opacity: 0;
+        transform: translateY(20px);
+    }
+    to {
+        opacity: 1;
+        transform: translateY(0);
+    }
+}
+
+.main .block-container > div {
+    animation: fadeIn 0.8s ease;
+}
+</style>
+"""
+
+# Streamlit caching helpers — every widget interaction reruns the whole
+# script, so these keep the client and search results alive across reruns
+@st.cache_resource
+def get_anthropic_client(api_key: str):
+    """Construct the Anthropic client once per API key"""
+    import anthropic
+    return anthropic.Anthropic(api_key=api_key)
+
+class SimulatedResultsError(Exception):
+    """Raised by cached_search when some categories fell back to simulated
+    placeholders, so st.cache_data doesn't memoize the fabricated results;
+    carries the partial results so the caller can still render them"""
+
+    def __init__(self, results: Dict[str, Any], failed_categories: List[str]):
+        super().__init__(f"Search fell back to simulated results for: {', '.join(failed_categories)}")
+        self.results = results
+        self.failed_categories = failed_categories
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def cached_search(_agent, company_name: str, location: str) -> Tuple[Dict[str, Any], List[str]]:
+    """Run the research searches, memoized on (company, location) for an hour
+
+    Only fully genuine runs are memoized: a transient search failure would
+    otherwise pin its placeholder results for the whole TTL.
+    """
+    results, failed_categories = asyncio.run(_agent.search_company_info(company_name, location))
+    if failed_categories:
+        raise SimulatedResultsError(results, failed_categories)
+    return results, failed_categories
+
 # Streamlit Web Interface
 def main():
     st.set_page_config(
@@ -210,351 +883,9 @@ def main():
         initial_sidebar_state="expanded"
     )
     
-    # Custom CSS styling - SkyeStaq Brand Guidelines
-    st.markdown("""
-    <link href="https://fonts.googleapis.com/css2?family=Montserrat+Alternates:wght@600&family=Manrope:wght@600&display=swap" rel="stylesheet">
-
-    <style>
-    /* ==================== CSS Variables - Brand Colors ==================== */
-    :root {
-        --summit-slate: #333447;
-        --glen-fire: #CC6651;
-        --highland-sand: #D8C3A5;
-        --white: #ffffff;
-        --light-bg: #f9f8f6;
-        --light-gray: #e8e6e2;
-    }
-
-    /* ==================== Typography - Brand Guidelines ==================== */
-    /* H1: Main headers - Montserrat Alternates Semibold 600 */
-    h1, .stTitle {
-        font-family: 'Montserrat Alternates', sans-serif !important;
-        font-weight: 600 !important;
-        font-size: 2.67rem !important;
-        letter-spacing: -0.5px !important;
-        color: var(--glen-fire) !important;
-    }
-
-    /* H2-H6: Section headers - Manrope Semibold 600 */
-    h2, h3, h4, h5, h6, .stHeader {
-        font-family: 'Manrope', sans-serif !important;
-        font-weight: 600 !important;
-        color: var(--glen-fire) !important;
-    }
-
-    h2 {
-        font-size: 2rem !important;
-        letter-spacing: -0.5px !important;
-    }
-
-    /* Body text - Arial/Helvetica with enhanced readability */
-    body, .stMarkdown, p, div, span, label {
-        font-family: Arial, Helvetica, sans-serif !important;
-        font-size: 1.125rem !important;
-        line-height: 1.7 !important;
-        color: var(--summit-slate) !important;
-    }
-
-    /* ==================== Main App Layout ==================== */
-    .stApp {
-        background-color: var(--highland-sand);
-    }
-
-    /* Main content area with proper spacing */
-    .main .block-container {
-        padding-top: 3rem;
-        padding-bottom: 3rem;
-        padding-left: 2rem;
-        padding-right: 2rem;
-        background-color: var(--highland-sand);
-    }
-
-    /* Header/Title area - Summit Slate background */
-    header[data-testid="stHeader"] {
-        background-color: var(--summit-slate) !important;
-    }
-
-    /* Top toolbar area */
-    [data-testid="stToolbar"] {
-        background-color: var(--summit-slate) !important;
-    }
-
-    /* Main title section background */
-    .main .block-container > div:first-child {
-        background-color: var(--summit-slate);
-        margin: -3rem -2rem 1rem -2rem;
-        padding: 2rem 2rem 1.5rem 2rem;
-        border-radius: 0 0 16px 16px;
-    }
-
-    /* Subtitle/italics in title section - keep white on dark background */
-    .main .block-container > div:first-child em,
-    .main .block-container > div:first-child .stMarkdown em {
-        color: var(--highland-sand) !important;
-    }
-
-    /* Reduce spacing after divider following title */
-    .main .block-container > div:first-child hr {
-        margin-bottom: 0.5rem !important;
-    }
-
-    /* ==================== Sidebar Styling ==================== */
-    .css-1d391kg, [data-testid="stSidebar"] {
-        background-color: var(--summit-slate);
-        padding: 2rem 1rem;
-        width: 400px !important;
-        min-width: 400px !important;
-    }
-
-    /* Sidebar headings - reduced sizes for legibility */
-    [data-testid="stSidebar"] h2 {
-        color: var(--glen-fire) !important;
-        font-size: 1.5rem !important;
-        letter-spacing: 0px !important;
-        margin-bottom: 0.5rem !important;
-        margin-top: 0.5rem !important;
-    }
-
-    [data-testid="stSidebar"] h3 {
-        color: var(--glen-fire) !important;
-        font-size: 1.25rem !important;
-        letter-spacing: 0px !important;
-        margin-top: 0.75rem !important;
-        margin-bottom: 0.5rem !important;
-    }
-
-    /* Sidebar text and labels - keep white text in sidebar */
-    [data-testid="stSidebar"] p,
-    [data-testid="stSidebar"] label,
-    [data-testid="stSidebar"] div,
-    [data-testid="stSidebar"] span,
-    [data-testid="stSidebar"] .stMarkdown {
-        font-size: 0.95rem !important;
-        line-height: 1.5 !important;
-        color: var(--white) !important;
-    }
-
-    /* Sidebar captions - keep light color */
-    [data-testid="stSidebar"] .stCaption {
-        font-size: 0.85rem !important;
-        color: var(--highland-sand) !important;
-    }
-
-    /* Sidebar logo - 50% width, centered */
-    [data-testid="stSidebar"] img {
-        width: 50% !important;
-        margin-left: auto !important;
-        margin-right: auto !important;
-        display: block !important;
-        margin-bottom: 0.5rem !important;
-    }
-
-    /* Sidebar dividers - tighter spacing */
-    [data-testid="stSidebar"] hr {
-        margin-top: 0.5rem !important;
-        margin-bottom: 0.5rem !important;
-    }
-
-    /* Sidebar status messages - tighter spacing */
-    [data-testid="stSidebar"] .stSuccess,
-    [data-testid="stSidebar"] .stInfo,
-    [data-testid="stSidebar"] .stWarning,
-    [data-testid="stSidebar"] .stError {
-        margin-bottom: 0.25rem !important;
-        padding: 0.5rem !important;
-    }
-
-    /* ==================== Input Elements ==================== */
-    /* Text inputs with proper spacing */
-    .stTextInput > div > div > input {
-        background-color: var(--white);
-        color: var(--summit-slate);
-        border: 2px solid var(--light-gray);
-        border-radius: 8px;
-        padding: 0.75rem 1rem;
-        font-size: 1.125rem;
-        transition: all 0.3s ease;
-    }
-
-    .stTextInput > div > div > input:focus {
-        border-color: var(--glen-fire);
-        box-shadow: 0 0 0 3px rgba(204, 102, 81, 0.1);
-    }
-
-    /* Select box styling */
-    .stSelectbox > div > div {
-        background-color: var(--white);
-        border-radius: 8px;
-    }
-
-    .stSelectbox > div > div > div {
-        color: var(--summit-slate);
-        padding: 0.75rem 1rem;
-    }
-
-    /* ==================== Buttons - Brand Styled CTAs ==================== */
-    /* Primary button - Glen Fire */
-    .stButton > button {
-        background-color: var(--glen-fire);
-        color: var(--white);
-        border: none;
-        border-radius: 8px;
-        padding: 0.75rem 2rem;
-        font-weight: 600;
-        font-size: 1.125rem;
-        transition: all 0.3s ease;
-        box-shadow: 0 4px 12px rgba(204, 102, 81, 0.2);
-    }
-
-    .stButton > button:hover {
-        background-color: #d47561;
-        transform: translateY(-2px);
-        box-shadow: 0 6px 16px rgba(204, 102, 81, 0.3);
-    }
-
-    /* Download button */
-    .stDownloadButton > button {
-        background-color: var(--glen-fire);
-        color: var(--white);
-        border: none;
-        border-radius: 8px;
-        padding: 0.75rem 2rem;
-        font-weight: 600;
-        transition: all 0.3s ease;
-        box-shadow: 0 4px 12px rgba(204, 102, 81, 0.2);
-    }
-
-    .stDownloadButton > button:hover {
-        background-color: #d47561;
-        transform: translateY(-2px);
-        box-shadow: 0 6px 16px rgba(204, 102, 81, 0.3);
-    }
-
-    /* ==================== Cards and Panels ==================== */
-    /* Content cards with brand-specified styling */
-    [data-testid="stExpander"],
-    [data-testid="stAlert"] {
-        background-color: rgba(255, 255, 255, 0.05);
-        border-radius: 16px;
-        padding: 1.5rem;
-        box-shadow: 0 10px 30px rgba(51, 52, 71, 0.1);
-        border: 1px solid rgba(216, 195, 165, 0.1);
-    }
-
-    /* Expandable sections */
-    .streamlit-expanderHeader {
-        background-color: rgba(204, 102, 81, 0.1);
-        color: var(--glen-fire) !important;
-        border-radius: 8px;
-        padding: 1rem;
-        font-weight: 600;
-    }
-
-    .streamlit-expanderHeader:hover {
-        background-color: rgba(204, 102, 81, 0.2);
-    }
-
-    /* ==================== Status Messages ==================== */
-    /* Success/Info/Warning/Error with proper brand styling */
-    .stSuccess {
-        background-color: rgba(204, 102, 81, 0.1);
-        border-left: 4px solid var(--glen-fire);
-        border-radius: 8px;
-        padding: 1rem;
-    }
-
-    .stInfo {
-        background-color: rgba(216, 195, 165, 0.1);
-        border-left: 4px solid var(--highland-sand);
-        border-radius: 8px;
-        padding: 1rem;
-    }
-
-    .stWarning {
-        background-color: rgba(255, 183, 77, 0.1);
-        border-left: 4px solid #ffb74d;
-        border-radius: 8px;
-        padding: 1rem;
-    }
-
-    .stError {
-        background-color: rgba(239, 83, 80, 0.1);
-        border-left: 4px solid #ef5350;
-        border-radius: 8px;
-        padding: 1rem;
-    }
-
-    /* ==================== Progress Indicators ==================== */
-    .stProgress > div > div > div > div {
-        background-color: var(--glen-fire);
-    }
-
-    .stSpinner > div {
-        border-top-color: var(--glen-fire) !important;
-    }
-
-    /* ==================== Dividers and Spacing ==================== */
-    hr {
-        border: none;
-        border-top: 2px solid var(--light-gray);
-        margin: 2rem 0;
-        opacity: 0.2;
-    }
-
-    /* ==================== Code and Pre-formatted Text ==================== */
-    .stCode, code, pre {
-        background-color: rgba(51, 52, 71, 0.8);
-        color: var(--highland-sand);
-        border-radius: 8px;
-        padding: 1rem;
-        border: 1px solid var(--light-gray);
-    }
-
-    /* ==================== Captions and Helper Text ==================== */
-    .stCaption, caption, small {
-        color: var(--highland-sand) !important;
-        font-size: 0.9rem !important;
-        line-height: 1.5 !important;
-    }
-
-    /* ==================== Links ==================== */
-    a {
-        color: var(--glen-fire) !important;
-        text-decoration: none;
-        transition: all 0.3s ease;
-    }
-
-    a:hover {
-        color: var(--highland-sand) !important;
-        text-decoration: underline;
-    }
-
-    /* ==================== Metric Cards ==================== */
-    [data-testid="stMetric"] {
-        background-color: rgba(255, 255, 255, 0.05);
-        border: 1px solid rgba(204, 102, 81, 0.2);
-        border-radius: 16px;
-        padding: 1.5rem;
-        box-shadow: 0 10px 30px rgba(51, 52, 71, 0.1);
-    }
-
-    /* ==================== Animations ==================== */
-    @keyframes fadeIn {
-        from {
-            opacity: 0;
-            transform: translateY(20px);
-        }
-        to {
-            opacity: 1;
-            transform: translateY(0);
-        }
-    }
-
-    .main .block-container > div {
-        animation: fadeIn 0.8s ease;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    # Inject brand CSS (must be re-emitted each run: Streamlit drops
+    # elements that are not part of the current rerun)
+    st.markdown(_CSS, unsafe_allow_html=True)
     
     # Header
     st.title("Client Research Agent")
@@ -594,6 +925,23 @@ def main():
             st.warning("No API Key Provided")
             st.caption("Using fallback analysis")
 
+        st.markdown("---")
+        st.markdown("### Model")
+        model = st.selectbox(
+            "Model",
+            ANALYSIS_MODELS,
+            help="Haiku is faster and ~4x cheaper — plenty for this summarization. Pick Sonnet for deeper analysis.",
+            label_visibility="collapsed"
+        )
+
+        st.markdown("---")
+        st.markdown("### Caching")
+        use_cache = st.checkbox(
+            "Use cached results",
+            value=True,
+            help="Reuse recent search and analysis results to skip network and API costs. Uncheck to force fresh research."
+        )
+
         st.markdown("---")
         st.markdown("### Security Note")
         st.caption("API keys are not stored or logged. They're only used for this session.")
@@ -653,41 +1001,64 @@ def main():
             st.success(f"Ready to research: **{company_name}**{location_text}")
             st.info(f"Meeting type: **{meeting_type}**")
     
-    # Generate research
+    # Generate research only on an explicit button press. The briefing lives
+    # in session_state so reruns (e.g. clicking the download button
+    # re-executes this whole script with the button unpressed) re-render it
+    # instead of re-running the network-heavy pipeline
     if generate_button and company_name.strip():
+        briefing_key = (company_name, location, meeting_type, model)
         st.markdown("---")
         location_text = f" in {location}" if location.strip() else ""
         st.header(f"Researching {company_name}{location_text}")
-        
-        # Initialize agent with API key from sidebar
-        agent = ClientResearchAgent(api_key=api_key)
-        
-        # Perform research
-        search_results = agent.search_company_info(company_name, location)
-        
+
+        # Initialize agent with API key, model, and cache preference from sidebar
+        agent = ClientResearchAgent(api_key=api_key, use_cache=use_cache, model=model)
+
+        # Perform research (all searches and page fetches run concurrently);
+        # progress UI stays out here so the cached search function stays pure
+        status_text = st.empty()
+        status_text.text("🔍 Searching for news, financials, and AI trends...")
+        if use_cache:
+            try:
+                search_results, failed_categories = cached_search(agent, company_name, location)
+            except SimulatedResultsError as e:
+                search_results, failed_categories = e.results, e.failed_categories
+        else:
+            search_results, failed_categories = asyncio.run(agent.search_company_info(company_name, location))
+        status_text.text("✅ Search complete!")
+        for category in failed_categories:
+            st.warning(f"Search failed for {category.replace('_', ' ')} — using simulated placeholder results")
+
         # Analyze findings
         analysis = agent.analyze_findings(company_name, meeting_type, search_results)
-        
+
         # Generate briefing
-        briefing = agent.generate_briefing(company_name, meeting_type, analysis)
-        
+        st.session_state.briefing = agent.generate_briefing(company_name, meeting_type, analysis)
+        st.session_state.briefing_key = briefing_key
+        st.session_state.briefing_results = search_results
+
+    # Always render from session_state so the briefing survives reruns
+    if 'briefing' in st.session_state:
+        briefing = st.session_state.briefing
+        briefing_company, _, briefing_meeting, _ = st.session_state.briefing_key
+
         # Display results
         st.markdown("---")
         st.header("📄 Generated Briefing")
-        
+
         # Show briefing content
         st.markdown(briefing)
-        
+
         # Download functionality
         st.markdown("---")
         st.header("💾 Download Options")
-        
+
         col1, col2 = st.columns([1, 1])
-        
+
         with col1:
             # Create filename
-            filename = f"{company_name.lower().replace(' ', '_')}_briefing_{datetime.now().strftime('%Y%m%d_%H%M')}.md"
-            
+            filename = f"{briefing_company.lower().replace(' ', '_')}_briefing_{datetime.now().strftime('%Y%m%d_%H%M')}.md"
+
             # Download button
             st.download_button(
                 label="📥 Download Briefing (Markdown)",
@@ -695,14 +1066,74 @@ def main():
                 file_name=filename,
                 mime="text/markdown"
             )
-        
+
         with col2:
             st.success("✅ Research Complete!")
-            st.caption(f"Briefing ready for {meeting_type} meeting")
-        
+            st.caption(f"Briefing ready for {briefing_meeting} meeting")
+
         # Show search results (expandable)
         with st.expander("🔍 View Raw Search Results"):
-            st.json(search_results)
+            st.json(st.session_state.briefing_results)
+
+    # Bulk mode — research several companies at once with a single AI call
+    st.markdown("---")
+    st.header("📦 Bulk Mode")
+    st.caption("Upload a CSV with one company name per row (first column is used)")
+
+    uploaded = st.file_uploader("Company CSV", type=["csv"], label_visibility="collapsed")
+    if uploaded is not None:
+        # Dedupe while keeping order: duplicate names would collide on the
+        # per-company download widget keys below
+        companies = []
+        seen = set()
+        for row in csv.reader(io.TextIOWrapper(uploaded, encoding='utf-8')):
+            name = row[0].strip() if row else ""
+            if name and name.lower() != 'company' and name.lower() not in seen:
+                seen.add(name.lower())
+                companies.append(name)
+
+        st.info(f"Loaded {len(companies)} companies")
+
+        use_batch_api = st.checkbox(
+            "Use Anthropic Batch API (50% cost, up to 24h turnaround)",
+            value=False,
+            help="Routes analysis through the offline Batch Messages API. Half the price, but the page has to wait for the batch to finish — best for non-urgent runs."
+        )
+
+        if companies and st.button("🔍 Run Bulk Research"):
+            agent = ClientResearchAgent(api_key=api_key, use_cache=use_cache, model=model)
+
+            with st.spinner(f"Researching {len(companies)} companies..."):
+                results_by_company, failed_by_company = asyncio.run(agent.batch_search(companies, location))
+                for company, failed_categories in failed_by_company.items():
+                    st.warning(f"Search failed for {company} ({', '.join(c.replace('_', ' ') for c in failed_categories)}) — using simulated placeholder results")
+                if use_batch_api:
+                    batch_items = [
+                        (company, meeting_type, results_by_company.get(company, {}))
+                        for company in companies
+                    ]
+                    analyses = dict(zip(companies, agent.analyze_findings_batch(batch_items)))
+                else:
+                    analyses = agent.batch_analyze(companies, meeting_type, results_by_company)
+
+            st.session_state.bulk_briefings = {
+                company: agent.generate_briefing(company, meeting_type, analyses[company])
+                for company in companies
+            }
+
+    # Always render bulk briefings from session_state so they survive the
+    # rerun each per-company download click triggers
+    if st.session_state.get('bulk_briefings'):
+        for company, briefing in st.session_state.bulk_briefings.items():
+            with st.expander(f"📄 {company}"):
+                st.markdown(briefing)
+                st.download_button(
+                    label="📥 Download Briefing (Markdown)",
+                    data=briefing,
+                    file_name=f"{company.lower().replace(' ', '_')}_briefing_{datetime.now().strftime('%Y%m%d_%H%M')}.md",
+                    mime="text/markdown",
+                    key=f"download_{company}"
+                )
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
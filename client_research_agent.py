@@ -4,22 +4,82 @@ Client Research Prep Agent
 Gathers recent company intel for pre-meeting preparation
 """
 
-import anthropic
 import os
 import requests
+from requests.adapters import HTTPAdapter, Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import json
 from datetime import datetime, timedelta
 from typing import Dict, List, Any
-from googlesearch import search
 from dotenv import load_dotenv
 
+# anthropic and googlesearch are imported lazily inside the functions that
+# use them to keep startup fast when those paths aren't exercised
+
+from llm_cache import LLMCache, ANALYSIS_CACHE_TTL, SEARCH_CACHE_TTL
+from semantic_cache import SemanticCache
+
 # Load environment variables from .env file
 load_dotenv()
 
+# Haiku is roughly 4x cheaper and 2x faster than Sonnet and is plenty for
+# this structured summarization task
+DEFAULT_MODEL = "claude-3-5-haiku-20241022"
+
+# Stable analysis instructions, hoisted so the text is byte-identical across
+# calls and kept out of the per-company user message. Note: at ~70 tokens this
+# is far below Anthropic's minimum cacheable prefix (1024+ tokens depending on
+# model), so no cache_control marker is set — add one only if the
+# instructions ever grow past that threshold
+ANALYSIS_INSTRUCTIONS = """You are preparing research for an AI consulting firm ahead of a client meeting.
+
+Analyze the research provided about the company and provide:
+1. Key Company Insights (3-5 bullet points)
+2. Potential AI Pain Points to Explore (3-4 specific areas)
+3. Conversation Starters (3-4 strategic questions)
+
+Format the response as clear, actionable insights for a consulting meeting."""
+
+def extract_title(head: bytes) -> str:
+    """Extract the page <title> from the first chunk of an HTML response"""
+    try:
+        from selectolax.parser import HTMLParser
+        node = HTMLParser(head).css_first('title')
+        if node is not None:
+            title = node.text(strip=True)
+            if title:
+                return title
+    except ImportError:
+        # selectolax not installed; fall back to a plain string scan
+        text = head.decode('utf-8', errors='ignore')
+        if '<title>' in text:
+            start = text.find('<title>') + 7
+            end = text.find('</title>', start)
+            if end > start:
+                return text[start:end].strip()
+    except Exception:
+        pass
+    return "Search Result"
+
 class ClientResearchAgent:
-    def __init__(self):
+    def __init__(self, use_cache: bool = True, model: str = DEFAULT_MODEL):
         self.anthropic_client = None
+        self.use_cache = use_cache
+        self.model = model
+        self.cache = LLMCache()
+        self.semantic_cache = SemanticCache()
+        # One pooled session for all page fetches: keep-alive skips the
+        # TCP+TLS handshake on repeated hits to the same host
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=20,
+            max_retries=Retry(total=1, backoff_factor=0.2)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         if os.getenv('ANTHROPIC_API_KEY'):
+            import anthropic
             self.anthropic_client = anthropic.Anthropic(api_key=os.getenv('ANTHROPIC_API_KEY'))
     
     def search_company_info(self, company_name: str) -> Dict[str, Any]:
@@ -30,61 +90,85 @@ class ClientResearchAgent:
             'ai_trends': f"{company_name} AI artificial intelligence technology adoption digital transformation"
         }
         
+        # The searches are I/O-bound, so running them in threads overlaps
+        # the network waits instead of paying for them back-to-back
         results = {}
-        for category, query in searches.items():
-            print(f"🔍 Searching for {category.replace('_', ' ')}...")
-            try:
-                results[category] = self.perform_google_search(query)
-            except Exception as e:
-                print(f"⚠️  Search failed for {category}: {e}")
-                results[category] = self.simulate_search_results(query)
-        
-        return results
+        with ThreadPoolExecutor(max_workers=len(searches)) as executor:
+            futures = {
+                executor.submit(self.perform_google_search, query): (category, query)
+                for category, query in searches.items()
+            }
+            for future in as_completed(futures):
+                category, query = futures[future]
+                try:
+                    results[category] = future.result()
+                    print(f"✅ Finished searching {category.replace('_', ' ')}")
+                except Exception as e:
+                    print(f"⚠️  Search failed for {category}: {e}")
+                    results[category] = self.simulate_search_results(query)
+
+        # Preserve the category order regardless of completion order
+        return {category: results[category] for category in searches}
     
     def perform_google_search(self, query: str, num_results: int = 5) -> List[Dict[str, str]]:
         """Perform actual Google search using googlesearch-python"""
+        cache_key = LLMCache.cache_key({'search': query, 'num_results': num_results})
+        if self.use_cache:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         search_results = []
-        
+
+        from googlesearch import search
+
         try:
-            # Get search results
-            urls = list(search(query, num_results=num_results, sleep_interval=1))
-            
-            for i, url in enumerate(urls):
-                # For each URL, try to get title and snippet
-                try:
-                    response = requests.get(url, timeout=5, headers={
-                        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-                    })
-                    
-                    # Extract title from HTML (basic extraction)
-                    title = "Search Result"
-                    if '<title>' in response.text:
-                        start = response.text.find('<title>') + 7
-                        end = response.text.find('</title>', start)
-                        if end > start:
-                            title = response.text[start:end].strip()
-                    
-                    search_results.append({
-                        "title": title[:100] + "..." if len(title) > 100 else title,
-                        "snippet": f"Search result {i+1} for: {query}",
-                        "url": url,
-                        "date": datetime.now().strftime("%Y-%m-%d")
-                    })
-                except Exception as e:
-                    # If we can't fetch the page, still include the URL
-                    search_results.append({
-                        "title": f"Search Result {i+1}",
-                        "snippet": f"Found via search for: {query}",
-                        "url": url,
-                        "date": datetime.now().strftime("%Y-%m-%d")
-                    })
-        
+            # advanced=True returns titles and descriptions directly, so most
+            # results need no follow-up page fetch at all
+            # sleep_interval=0: the library's per-page sleep added seconds of
+            # pure wait per query; results stream lazily from the generator
+            for i, hit in enumerate(search(query, num_results=num_results, sleep_interval=0, advanced=True)):
+                url = getattr(hit, 'url', str(hit))
+                title = (getattr(hit, 'title', None) or '').strip()
+                description = (getattr(hit, 'description', None) or '').strip()
+
+                if not title:
+                    # Rare: no title in the search result; fall back to a
+                    # bounded page fetch
+                    title = self.fetch_title(url)
+
+                search_results.append({
+                    "title": title[:100] + "..." if len(title) > 100 else title,
+                    "snippet": description or f"Search result {i+1} for: {query}",
+                    "url": url,
+                    "date": datetime.now().strftime("%Y-%m-%d")
+                })
+
         except Exception as e:
             print(f"Google search failed: {e}")
             return self.simulate_search_results(query)
-        
-        return search_results if search_results else self.simulate_search_results(query)
+
+        if not search_results:
+            return self.simulate_search_results(query)
+
+        if self.use_cache:
+            self.cache.set(cache_key, search_results, ttl=SEARCH_CACHE_TTL)
+        return search_results
     
+    def fetch_title(self, url: str) -> str:
+        """Fetch a page's title with a bounded streamed read (fallback path)"""
+        try:
+            response = self.session.get(url, timeout=5, stream=True, headers={
+                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+            })
+            # Titles live in <head>; reading ~64KB bounds bandwidth and
+            # memory instead of downloading the whole page
+            head = response.raw.read(65536, decode_content=True)
+            response.close()
+            return extract_title(head)
+        except Exception:
+            return "Search Result"
+
     def simulate_search_results(self, query: str) -> List[Dict[str, str]]:
         """Simulate search results - fallback when real search fails"""
         return [
@@ -101,27 +185,51 @@ class ClientResearchAgent:
         if not self.anthropic_client:
             return self.generate_fallback_analysis(company_name, meeting_type, search_results)
         
-        prompt = f"""
-        Analyze the following research about {company_name} for a {meeting_type} meeting with an AI consulting firm.
+        # Compact one-line-per-result format: pretty-printed JSON (indents,
+        # snippets, dates) roughly triples the input tokens for no extra signal
+        research_lines = "\n".join(
+            f"[{category}] {result.get('title', '')} — {result.get('url', '')}"
+            for category, results in search_results.items()
+            for result in results
+        )
 
-        Research Results:
-        {json.dumps(search_results, indent=2)}
+        prompt = f"""Company: {company_name}
+Meeting: {meeting_type}
 
-        Please provide:
-        1. Key Company Insights (3-5 bullet points)
-        2. Potential AI Pain Points to Explore (3-4 specific areas)
-        3. Conversation Starters (3-4 strategic questions)
+Research Results:
+{research_lines}"""
+
+        cache_key = LLMCache.cache_key({
+            'model': self.model,
+            'system': ANALYSIS_INSTRUCTIONS,
+            'prompt': prompt
+        })
+        # Only the company name is fuzzy-matched; meeting type and model must
+        # match exactly so one client's discovery analysis never stands in
+        # for a proposal and a Sonnet run never gets a Haiku answer
+        semantic_metadata = {'meeting_type': meeting_type, 'model': self.model}
+        if self.use_cache:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+            # Exact hash missed; try a near-match on the company name
+            # (catches variants like "Tesla Inc" vs "Tesla")
+            cached = self.semantic_cache.get(company_name, semantic_metadata, max_age=ANALYSIS_CACHE_TTL)
+            if cached is not None:
+                return cached
 
-        Format the response as clear, actionable insights for a consulting meeting.
-        """
-        
         try:
             message = self.anthropic_client.messages.create(
-                model="claude-3-5-sonnet-20241022",
+                model=self.model,
                 max_tokens=1000,
+                system=ANALYSIS_INSTRUCTIONS,
                 messages=[{"role": "user", "content": prompt}]
             )
-            return message.content[0].text
+            analysis = message.content[0].text
+            if self.use_cache:
+                self.cache.set(cache_key, analysis, ttl=ANALYSIS_CACHE_TTL)
+                self.semantic_cache.put(company_name, analysis, semantic_metadata)
+            return analysis
         except Exception as e:
             print(f"⚠️  AI analysis failed: {e}")
             return self.generate_fallback_analysis(company_name, meeting_type, search_results)
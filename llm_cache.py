@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+On-disk response cache for LLM calls and search queries
+Keys are SHA-256 hashes of the request payload; entries are JSON blobs with a TTL
+"""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+try:
+    # Rust JSON encoder: several times faster than stdlib json and emits
+    # canonical bytes, ideal for hash keys; stdlib json is the fallback
+    import orjson
+except ImportError:
+    orjson = None
+
+# How long cached entries stay valid
+ANALYSIS_CACHE_TTL = 3600       # 1 hour for AI analysis responses
+SEARCH_CACHE_TTL = 86400        # 1 day for search results
+
+
+class LLMCache:
+    """Simple file-backed cache storing one JSON blob per key under ./.cache"""
+
+    def __init__(self, cache_dir: str = ".cache"):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(exist_ok=True)
+
+    @staticmethod
+    def cache_key(payload: Any) -> str:
+        """Deterministic key from any JSON-serializable payload"""
+        if orjson is not None:
+            serialized = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS, default=str)
+        else:
+            serialized = json.dumps(payload, sort_keys=True, default=str).encode('utf-8')
+        return hashlib.sha256(serialized).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None on miss/expiry/corruption"""
+        path = self.cache_dir / f"{key}.json"
+        try:
+            data = path.read_bytes()
+            entry = orjson.loads(data) if orjson is not None else json.loads(data)
+        except (OSError, ValueError):
+            return None
+
+        expires_at = entry.get('expires_at')
+        if expires_at is not None and time.time() > expires_at:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            return None
+
+        return entry.get('value')
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value; ttl is in seconds (None = never expires)"""
+        path = self.cache_dir / f"{key}.json"
+        entry = {
+            'expires_at': time.time() + ttl if ttl else None,
+            'value': value
+        }
+        try:
+            if orjson is not None:
+                path.write_bytes(orjson.dumps(entry))
+            else:
+                path.write_text(json.dumps(entry), encoding='utf-8')
+        except OSError as e:
+            # Caching is best-effort; never fail the request over it
+            print(f"⚠️  Cache write failed: {e}")
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Semantic near-match cache for AI analysis responses
+Embeds only the fuzzy part of the key (the company name) with a small local
+model; everything else (meeting type, model, ...) is matched exactly via
+per-row metadata, so "Tesla Inc" can hit a "Tesla" entry but a discovery
+analysis never stands in for a proposal one
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Small CPU-friendly embedding model (~22MB)
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+SIMILARITY_THRESHOLD = 0.9
+
+# How many nearest neighbors to consider; the closest row may belong to a
+# different metadata bucket (other meeting type/model) than the one wanted
+SEARCH_CANDIDATES = 5
+
+
+class SemanticCache:
+    """Embedding-backed cache with a PUT/GET interface
+
+    Rows are stored in a JSON file alongside a FAISS inner-product index of
+    normalized embeddings (inner product == cosine similarity). Each row
+    carries the exact-match metadata and a creation timestamp, checked after
+    the nearest-neighbor lookup. Degrades to a no-op when
+    sentence-transformers/faiss aren't installed.
+    """
+
+    def __init__(self, cache_dir: str = ".cache/semantic", threshold: float = SIMILARITY_THRESHOLD):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.threshold = threshold
+        self.index_path = self.cache_dir / "index.faiss"
+        self.store_path = self.cache_dir / "store.json"
+        self._model = None
+        self._index = None
+        self._store = None
+        self._unavailable = False
+
+    def _load(self) -> bool:
+        """Lazily load the embedding model, index, and row store"""
+        if self._unavailable:
+            return False
+        if self._model is not None:
+            return True
+
+        try:
+            import faiss
+            from sentence_transformers import SentenceTransformer
+        except ImportError:
+            # Optional dependencies; fall back to exact-match caching only
+            self._unavailable = True
+            return False
+
+        try:
+            self._model = SentenceTransformer(EMBEDDING_MODEL)
+            if self.index_path.exists():
+                self._index = faiss.read_index(str(self.index_path))
+            else:
+                dimension = self._model.get_sentence_embedding_dimension()
+                self._index = faiss.IndexFlatIP(dimension)
+            if self.store_path.exists():
+                with open(self.store_path, 'r', encoding='utf-8') as f:
+                    self._store = json.load(f)
+            else:
+                self._store = []
+        except Exception as e:
+            print(f"⚠️  Semantic cache unavailable: {e}")
+            self._unavailable = True
+            return False
+
+        return True
+
+    def _embed(self, key: str):
+        """Return the normalized embedding for a key as a (1, dim) array"""
+        return self._model.encode([key], normalize_embeddings=True)
+
+    def get(self, key: str, metadata: Dict[str, str], max_age: Optional[float] = None) -> Optional[Any]:
+        """Return the value of the nearest key above the threshold
+
+        Only rows whose metadata equals `metadata` qualify, and rows older
+        than `max_age` seconds are skipped so near-match hits don't outlive
+        the exact cache's TTL.
+        """
+        if not self._load() or self._index.ntotal == 0:
+            return None
+
+        try:
+            count = min(SEARCH_CANDIDATES, self._index.ntotal)
+            scores, row_ids = self._index.search(self._embed(key), count)
+            for score, row_id in zip(scores[0], row_ids[0]):
+                if row_id < 0 or float(score) <= self.threshold:
+                    continue
+                row = self._store[int(row_id)]
+                # Skip rows from the pre-metadata store format
+                if not isinstance(row, dict) or 'value' not in row:
+                    continue
+                if row.get('metadata') != metadata:
+                    continue
+                if max_age is not None and time.time() - row.get('created_at', 0) > max_age:
+                    continue
+                return row['value']
+        except Exception as e:
+            print(f"⚠️  Semantic cache lookup failed: {e}")
+        return None
+
+    def put(self, key: str, value: Any, metadata: Dict[str, str]) -> None:
+        """Store a value under a key's embedding and persist to disk"""
+        if not self._load():
+            return
+
+        try:
+            import faiss
+            self._index.add(self._embed(key))
+            self._store.append({
+                'metadata': metadata,
+                'created_at': time.time(),
+                'value': value
+            })
+            faiss.write_index(self._index, str(self.index_path))
+            with open(self.store_path, 'w', encoding='utf-8') as f:
+                json.dump(self._store, f)
+        except Exception as e:
+            # Caching is best-effort; never fail the request over it
+            print(f"⚠️  Semantic cache write failed: {e}")